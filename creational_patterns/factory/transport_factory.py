@@ -1,9 +1,14 @@
-from abc import ABC, abstractmethod
-
 # Product
-class Transport(ABC):
-    @abstractmethod
-    def deliver(self): pass
+class Transport:
+    # Checked once when a subclass is defined, not on every instantiation
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Inherited implementations are fine; only the base stub itself is rejected
+        if cls.deliver is Transport.deliver:
+            raise TypeError(f"{cls.__name__} must define deliver()")
+
+    def deliver(self):
+        raise NotImplementedError
 
 class Truck(Transport):
     def deliver(self):
@@ -15,10 +20,14 @@ class Ship(Transport):
 
 
 # Creator (Factory Method)
-class Logistics(ABC):
-    @abstractmethod
-    def create_transport(self) -> Transport: 
-        pass
+class Logistics:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.create_transport is Logistics.create_transport:
+            raise TypeError(f"{cls.__name__} must define create_transport()")
+
+    def create_transport(self) -> Transport:
+        raise NotImplementedError
 
 class RoadLogistics(Logistics):
     def create_transport(self) -> Transport:
@@ -35,4 +44,4 @@ def client_code(factory: Logistics):
     print(transport.deliver())
 
 client_code(RoadLogistics())  # Truck
-client_code(SeaLogistics())   # Ship
+client_code(SeaLogistics())   # Ship
\ No newline at end of file
@@ -3,28 +3,30 @@ needs to stay untouched and we want to create an exact copy of it, allowing chan
 in some parts of the copy.
 """
 
-import copy
+from typing import NamedTuple
+
+class Website(NamedTuple):
+    """ Immutable website record, so a clone with overrides is just _replace(). """
+    name: str
+    domain: str
+    description: str
+    author: str
+    category: str = ""
+    creation_date: str = ""
+    technologies: tuple = ()
+    keywords: tuple = ()
+
+    def __str__(self):
+        summary = [f"Website '{self.name}'\n"]
+        for attr in _KEY_ORDER:
+            summary.append(f"{attr}: {getattr(self, attr)}\n")
+        return ''.join(summary)
+
+
+# Every Website has the same fields, so the printed order is sorted once at import
+_KEY_ORDER = tuple(sorted(set(Website._fields) - {'name'}))
 
-class Website:
-    def __init__(self, name, domain, description, author, **kwargs):
-        """ Examples of optional attributes: category, creation date, technologies, keywords"""
-        self.name = name
-        self.domain = domain
-        self.description = description
-        self.author = author
-        for key in kwargs:
-            setattr(self, key, kwargs[key])
 
-        def __str__(self):
-            summary = [f"Website '{self.name}'\n"]
-            infos = vars(self).items()
-            ordered_infos = sorted(infos)
-            for attr, val in ordered_infos:
-                if attr == "name":
-                    continue
-                summary.append(f"{attr}: {val}\n")
-            return ''.join(summary)
-        
 class Prototype:
     def __init__(self):
         self.objects = dict()
@@ -33,17 +35,13 @@ class Prototype:
         self.objects[identifier] = obj
     
     def unregister(self, identifier):
-        del self.object[identifier]
+        del self.objects[identifier]
 
     def clone(self, identifier, **attrs):
         found = self.objects.get(identifier)
-        if not found:
+        if found is None:
             raise ValueError(f"Incorrect object identifier: {identifier}")
-        obj = copy.deepcopy(found)
-        for key in attrs:
-            setattr(obj, key, attrs[key])
-        
-        return obj
+        return found._replace(**attrs)
     
 keywords = ("python", "data", "apis", "automation")
 site_1 = Website("Content",
@@ -64,4 +62,5 @@ site_2 = prototype.clone(identifier,
                          creation_date="Today")
 
 # Test
-print(site_1 is site_2)
\ No newline at end of file
+print(site_1 is site_2)
+print(site_2)
\ No newline at end of file
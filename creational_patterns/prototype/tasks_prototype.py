@@ -5,9 +5,11 @@ Instead of rebuilding each from scratch, we clone a prototype and apply a few ov
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
-import copy
+from copy import deepcopy as _deepcopy
 import uuid
 
+_uuid4 = uuid.uuid4
+
 @dataclass
 class Task:
     kind: str                     # "bug", "feature", "hotfix", ...
@@ -16,13 +18,13 @@ class Task:
     labels: List[str] = field(default_factory=list)
     checklist: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))  # unique identity
+    id: str = field(default_factory=lambda: str(_uuid4()))  # unique identity
 
     # Prototype-friendly clone: deep by default, with convenient overrides
     def clone(self, **overrides) -> "Task":
-        new_obj = copy.deepcopy(self)
+        new_obj = _deepcopy(self)
         # Give clones a new identity (common in trackers/DBs)
-        new_obj.id = str(uuid.uuid4())
+        new_obj.id = str(_uuid4())
         for k, v in overrides.items():
             setattr(new_obj, k, v)
         return new_obj
\ No newline at end of file
@@ -1,18 +1,19 @@
 """ Cache using a Singleton Decorator
 """
-from threading import Lock
 
 def singleton(cls):
     """ A decorator that turns a class into a singleton """
     _instances = {}
-    lock: Lock = Lock()
 
     def get_instance(*args, **kwargs):
-        with lock:
-            if cls not in _instances:
-                print(f"Creating a single instance of {cls.__name__}")
-                _instances[cls] = cls(*args, **kwargs)
-        return _instances[cls]
+        inst = _instances.get(cls)
+        if inst is not None:
+            return inst
+        print(f"Creating a single instance of {cls.__name__}")
+        inst = cls(*args, **kwargs)
+        # dict.setdefault is atomic under the GIL: if two threads race here,
+        # both may construct, but the first writer wins and both get the same object.
+        return _instances.setdefault(cls, inst)
     return get_instance
 
 @singleton
@@ -36,13 +36,16 @@ organize_performance() method (on the Club class); it has no idea about play()
 or dance() (on the respective class from the external)"""
 
 """ How can we make the code work without changing the Musician and Dancer classes?
-We create a generic adapter class that allows us to adapt a number of objects with different
-interfaces, into one unified interface."""
+We create an adapter class that exposes one method of each object, whatever it is called,
+as the organize_event() the client already knows."""
 
 class Adapter:
-    def __init__(self, obj, adapted_methods):
+    # The adapted interface is fixed (organize_event), so slots replace the per-instance __dict__
+    __slots__ = ('obj', 'organize_event')
+
+    def __init__(self, obj, organize_event):
         self.obj = obj
-        self.__dict__.update(adapted_methods)
+        self.organize_event = organize_event
 
     def __str__(self):
         return str(self.obj)
@@ -53,13 +56,14 @@ treat is as is.
 - The incompatible objects need to be adapted first, using the Adapter class.
 """
 
+# Which method of each incompatible class stands in for organize_event()
+_ADAPT_TABLE = {Musician: 'play', Dancer: 'dance'}
+
 objects = [Club("Jazz Cafe"), Musician("Axl Rose"), Dancer("Shane Sparks")]
+adapt_lookup = _ADAPT_TABLE.get
 for obj in objects:
-    if hasattr(obj, "play") or hasattr(obj, "dance"):
-        if hasattr(obj, "play"):
-            adapted_methods = dict(organize_event=obj.play)
-        elif hasattr(obj, "dance"):
-            dict(organize_event=obj.dance)
+    method_name = adapt_lookup(type(obj))
+    if method_name is not None:
         # referencing the adapted object here
-        obj = Adapter(obj, adapted_methods)
+        obj = Adapter(obj, getattr(obj, method_name))
     print(f"{obj} {obj.organize_event()}")
\ No newline at end of file
@@ -7,6 +7,8 @@ The goal is to print using a uniform interface, without worrying about the print
 details.
 """
 
+import sys
+
 # Define the target interface
 class Printer:
     """ Target interface expected by the application """
@@ -17,12 +19,12 @@ class Printer:
 class OldPrinter:
     """ An old printer that only prints plain text """
     def print_text(self, text: str):
-        print(f"[OldPrinter] Printing text: {text}")
+        sys.stdout.write(f"[OldPrinter] Printing text: {text}\n")
 
 class ModernPrinter:
     """ A modern printer that expects formatted data """
     def print_data(self, data: dict):
-        print(f"[ModernPrinter] Printing with settings: {data}")
+        sys.stdout.write(f"[ModernPrinter] Printing with settings: {data}\n")
 
 # Create adapter classes
 # These adapters wrap the existing printer objects and translate calls from
@@ -32,22 +34,23 @@ class OldPrinterAdapter(Printer):
     """ Adapter for OldPrinter to match the Printer interface """
     def __init__(self, old_printer: OldPrinter):
         self.old_printer = old_printer
-
-    def print_document(self, content: str):
-        # Translate the call to old printer's interface
-        print("[Adapter] Converting request for OldPrinter")
-        self.old_printer.print_text(content)
+        # The signatures already line up, so translate the call once by binding
+        # the old printer's method directly: no extra frame per print
+        self.print_document = old_printer.print_text
 
 class ModernPrinterAdapter(Printer):
     """ Adapter for ModernPrinter to match the Printer interface. """
     def __init__(self, modern_printer: ModernPrinter):
         self.modern_printer = modern_printer
+        # Font and size never change, so build the settings once and only swap the text.
+        # ModernPrinter doesn't keep the dict; an adaptee that does would need a copy().
+        self._data = {"text": "", "font": "Arial", "size": 12}
 
     def print_document(self, content: str):
         # Translate the call into the modern printer's expected data format
-        print("[Adapter] Converting request for ModernPrinter")
-        data = {"text": content, "font": "Arial", "size": 12}
-        self.modern_printer.print_data(data)
+        sys.stdout.write("[Adapter] Converting request for ModernPrinter\n")
+        self._data["text"] = content
+        self.modern_printer.print_data(self._data)
 
 # Client Code (Application Layer)
 def print_report(printer: Printer, text: str):
@@ -1,28 +1,38 @@
 """ Speed Sensor Adapter """
 
-from abc import ABC, abstractmethod
+from typing import Protocol
 
-class SpeedSensor(ABC):
-    @abstractmethod
+_MPH_TO_KMH = 1.60934
+
+class SpeedSensor(Protocol):
     def get_speed_kmh(self) -> float:
-        pass
+        ...
 
 class USCar:
+    __slots__ = ()
+
     def mph(self) -> float:
         return 60.0
     
 class EUCar:
+    __slots__ = ()
+
     def kph(self) -> float:
         return 100.0
     
-class USCarAdapter(SpeedSensor):
+class USCarAdapter:
+    __slots__ = ('car', '_mph')
+
     def __init__(self, car: USCar):
         self.car = car
+        self._mph = car.mph
     
-    def get_speed_kmh(self) -> float:
-        return self.car.mph() * 1.60934
+    def get_speed_kmh(self, _k: float = _MPH_TO_KMH) -> float:
+        return self._mph() * _k
     
-class EUCarAdapter(SpeedSensor):
+class EUCarAdapter:
+    __slots__ = ('car',)
+
     def __init__(self, car: EUCar):
         self.car = car
 
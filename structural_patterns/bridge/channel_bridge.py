@@ -3,75 +3,131 @@ Notification is the abstraction
 Channel is the Implementation
 """
 
-from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
+import io
+import sys
+import time
+from typing import Protocol, Sequence
 
 # Implementation hierarchy
-class Channel(ABC):
-    @abstractmethod
+class Channel(Protocol):
     def send(self, to: str, subject: str, body: str) -> None:
-        pass
+        ...
+
+class EmailChannel:
+    __slots__ = ()
 
-class EmailChannel(Channel):
     def send(self, to: str, subject: str, body: str) -> None:
-        print(f"[EMAIL] -> {to}\nSubject: {subject}\n {body}\n")
+        sys.stdout.write(f"[EMAIL] -> {to}\nSubject: {subject}\n {body}\n\n")
+
+class SMSChannel:
+    __slots__ = ()
 
-class SMSChannel(Channel):
     def send(self, to: str, subject: str, body: str) -> None:
         # SMS ignores subject and has length limits (simulated)
-        text = (subject + ": " + body)[:160]
-        print(f"[SMS] -> {to}\n{text}\n")
+        # Slice the inputs to the budget first instead of joining everything and slicing
+        budget = 160 - len(subject) - 2
+        if budget <= 0:
+            text = (subject[:160] + ": ")[:160]
+        else:
+            text = f"{subject}: {body[:budget]}"
+        sys.stdout.write(f"[SMS] -> {to}\n{text}\n\n")
+
+class SlackChannel:
+    __slots__ = ('room',)
 
-class SlackChannel(Channel):
     def __init__(self, room: str="general"):
         self.room = room
     
     def send(self, to: str, subject: str, body: str) -> None:
-        print(f"[SLACK]{self.room} @ {to}\n*{subject}*\n{body}\n")
+        sys.stdout.write(f"[SLACK]{self.room} @ {to}\n*{subject}*\n{body}\n\n")
+
+class DigestDeliveryError(Exception):
+    """ Raised by DigestNotification.flush() when some recipients could not be reached """
+    def __init__(self, failed: dict[str, BaseException]):
+        super().__init__(f"digest not delivered to: {', '.join(failed)}")
+        self.failed = failed
 
 # Abstraction Hierarchy (high-level notifications)
-class Notification(ABC):
+class Notification:
     """ High level behavior that delegates delivery to a Channel """
+    __slots__ = ('channel',)
+
+    # Shared by every notification: real channels block on network I/O, so
+    # independent sends can overlap instead of running one after another
+    _executor = ThreadPoolExecutor(max_workers=16)
+
     def __init__(self, channel: Channel):
         self.channel = channel
 
-    @abstractmethod
+    def send_async(self, to: str, subject: str, body: str) -> Future:
+        return self._executor.submit(self.channel.send, to, subject, body)
+
     def notify(self, to: str, title: str, message: str) -> None:
-        self.channel.send(to, title, message)
+        raise NotImplementedError
 
 class BasicNotification(Notification):
+    __slots__ = ()
+
     def notify(self, to: str, title: str, message: str) -> None:
         self.channel.send(to, title, message)
 
 class AlertNotification(Notification):
     """ Adds metadata, formatting, and a footer, without touching channels. """
+    __slots__ = ()
+
+    # (epoch second, formatted timestamp): alerts fired within the same second share one strftime
+    _ts_cache: tuple[int, str] = (0, "")
+
     def notify(self, to: str, title: str, message: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = int(time.time())
+        if AlertNotification._ts_cache[0] != now:
+            AlertNotification._ts_cache = (now, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"))
+        timestamp = AlertNotification._ts_cache[1]
         decorated_title = f"[ALERT] {title}"
         body = f"{message}\n\n - sent at {timestamp}"
         self.channel.send(to, decorated_title, body)
 
 class DigestNotification(Notification):
     """ Accumulates entries and flushes them as a single message """
+    __slots__ = ('_buffer',)
+
     def __init__(self, channel: Channel):
         super().__init__(channel)
-        self._buffer: list[str] = []
+        # Entries are written straight into the digest text, no list + join at flush time
+        self._buffer = io.StringIO()
 
     def add_entry(self, entry: str) -> None:
-        self._buffer.append(entry)
+        self._buffer.write("\n • ")
+        self._buffer.write(entry)
 
     def notify(self, to: str, title: str, message: str) -> None:
         self.add_entry(message)
         # no immediate send; use flush() when you want to deliver
         print("[Digest] queued:", message)
 
-    def flush(self, to: str, title: str) -> None:
-        if not self._buffer:
+    def flush(self, to: str | Sequence[str], title: str) -> None:
+        """ Send the digest and clear it once every recipient has it.
+        If some sends fail, the digest is kept and DigestDeliveryError lists only the
+        failed recipients, so flush(err.failed, title) retries without re-sending.
+        """
+        if not self._buffer.tell():
             print("[Digest] nothing to send.")
             return
-        combined = "\n • " + "\n • ".join(self._buffer)
-        self.channel.send(to, f"[DIGEST] {title}", combined)
-        self._buffer.clear()
+        subject = f"[DIGEST] {title}"
+        body = self._buffer.getvalue()
+        if isinstance(to, str):
+            self.channel.send(to, subject, body)
+        else:
+            # One concurrent send per recipient; wall time is the slowest send, not the sum
+            futures = {recipient: self.send_async(recipient, subject, body) for recipient in to}
+            wait(futures.values())
+            failed = {recipient: future.exception() for recipient, future in futures.items()
+                      if future.exception() is not None}
+            if failed:
+                raise DigestDeliveryError(failed)
+        self._buffer = io.StringIO()
 
 if __name__ == "__main__":
     # Channels (implementations)
@@ -13,46 +13,51 @@ separately.
 - Keep the abstraction methods stable and high-level (Remote methods call Device)
 - Compose them at runtime Remote(device)
 """
-from abc import ABC, abstractmethod
+import sys
+from typing import Protocol
 
-class Device(ABC):
-    @abstractmethod
+class Device(Protocol):
     def power(self):
-        pass
+        ...
 
-    @abstractmethod
     def volume(self, delta: int):
-        pass
+        ...
 
 # Implementations
-class TV(Device):
+class TV:
+    __slots__ = ('on', 'vol')
+
     def __init__(self):
         self.on = False
         self.vol = 10
 
     def power(self):
         self.on = not self.on
-        print("TV power:", self.on)
+        sys.stdout.write(f"TV power: {self.on}\n")
 
     def volume(self, delta):
         self.vol = max(0, self.vol + delta)
-        print("TV volume:", self.vol)
+        sys.stdout.write(f"TV volume: {self.vol}\n")
+
+class Radio:
+    __slots__ = ('on', 'vol')
 
-class Radio(Device):
     def __init__(self):
         self.on = False
         self.vol = 5
 
     def power(self):
         self.on = not self.on
-        print("Radio power:", self.on)
+        sys.stdout.write(f"Radio power: {self.on}\n")
 
     def volume(self, delta):
         self.vol = max(0, self.vol + delta)
-        print("Radio volume:", self.vol)
+        sys.stdout.write(f"Radio volume: {self.vol}\n")
 
 # Abstractions
 class Remote:
+    __slots__ = ('device',)
+
     def __init__(self, device: Device):
         self.device = device
 
@@ -69,8 +74,8 @@ if __name__ == "__main__":
     device = TV()
     r = Remote(device)
     r.toggle()
-    r.vol_up()
-    r.vol_down()
+    r.volume_up()
+    r.volume_down()
 
 """ Why bridge and not adapter?
 - Bridge splits one concept into two orthogonal hierarchies (remotes, devices) composed at runtime
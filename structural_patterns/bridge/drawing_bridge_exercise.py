@@ -11,15 +11,17 @@
 - Client code composes Shape(Renderer) at runtime and calls shape.draw()
 """
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-class Renderer(ABC):
-    @abstractmethod
+class Renderer:
+    __slots__ = ()
+
     def render(self, shape):
-        pass
+        raise NotImplementedError
 
 class ASCIIRenderer(Renderer):
+    __slots__ = ('shape',)
+
     def __init__(self, shape):
         self.shape = shape
 
@@ -27,6 +29,8 @@ class ASCIIRenderer(Renderer):
         print(f"[ASCII Renderer]: Rendering shape {self.shape}")
 
 class SVGRenderer(Renderer):
+    __slots__ = ('shape',)
+
     def __init__(self, shape):
         self.shape = shape
 
@@ -34,18 +38,19 @@ class SVGRenderer(Renderer):
         print(f"[SVG Renderer]: Rendering shape {self.shape}")
 
 class JSONRenderer(Renderer):
+    __slots__ = ('shape',)
+
     def __init__(self, shape):
         self.shape = shape
 
     def render(self, shape):
         print(f"[JSONRenderer] Rendering shape {self.shape}")
 
-class Shape(ABC):
+class Shape:
     renderer : Renderer
 
-    @abstractmethod
     def draw(self) -> str:
-        pass
+        raise NotImplementedError
 
 class Circle(Shape):
     pass
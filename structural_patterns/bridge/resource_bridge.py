@@ -5,8 +5,27 @@ required within each class, you can define the following special components:
 - An abstraction that applies to all the classes
 - A separate interface for the different objects involved
 """
-from abc import ABCMeta, abstractmethod
-from urllib import request, parse
+import codecs
+import shutil
+import sys
+from typing import Protocol
+from http import client
+from urllib import error, parse
+
+def _copy_to_stdout(src, length=64 * 1024):
+    """ Stream a binary file object to stdout in fixed-size chunks. """
+    out = sys.stdout
+    out.flush()
+    buffer = getattr(out, "buffer", None)
+    if buffer is not None:
+        shutil.copyfileobj(src, buffer, length)
+        buffer.flush()
+        return
+    # Text-only streams (StringIO, IDLE, Jupyter) have no byte buffer: decode as we go
+    decoder = codecs.getincrementaldecoder(getattr(out, "encoding", None) or "utf-8")("replace")
+    while chunk := src.read(length):
+        out.write(decoder.decode(chunk))
+    out.write(decoder.decode(b"", final=True))
 
 # Application where the user if going to manage and deliver content after fetching
 # it from diverese sources.
@@ -19,43 +38,96 @@ class ResourceContent:
     """ Define the abstraction's interface.
     Mantain a reference to an object which represents the Implementor.
     """
-    def __init__(self, imp):
+    def __init__(self, imp: "ResourceContentFetcher"):
         self._imp = imp
     
     def show_content(self, path):
         self._imp.fetch(path)
 
-""" As done so far, we define the equivalent of an interface in Python using two
-features of the language, the metaclass feature (which helps define the type of a type),
-and abstract base class (ABC)
+""" We define the equivalent of an interface in Python using a Protocol: implementations
+satisfy it structurally, so the interface costs nothing at runtime.
 """
-class ResourceContentFetcher(metaclass=ABCMeta):
+class ResourceContentFetcher(Protocol):
     """Define the interface for implementation classes that fetch content
     """
-    @abstractmethod
-    def fetch(path):
-        pass
+    def fetch(self, path) -> None:
+        ...
 
 # Now we can add an implementation class to fetch content from a web page or resource.
-class URLFetcher(ResourceContentFetcher):
+class URLFetcher:
     """ Implement the Implementor interface and define its concrete implementation.
+    Keep-alive connections are pooled per (scheme, host) and shared by all fetchers,
+    so repeated fetches from one host skip the TCP/TLS handshake.
     """
+    __slots__ = ()
+
+    _connections: dict[tuple[str, str], client.HTTPConnection] = {}
+    _max_redirects = 5
+
+    def _connection(self, key):
+        conn = self._connections.get(key)
+        if conn is None:
+            conn_cls = client.HTTPSConnection if key[0] == "https" else client.HTTPConnection
+            conn = self._connections[key] = conn_cls(key[1])
+        return conn
+
+    def _evict(self, key):
+        conn = self._connections.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+    def _get(self, conn, target):
+        try:
+            conn.request("GET", target)
+            return conn.getresponse()
+        except (client.RemoteDisconnected, ConnectionError):
+            # The server dropped an idle keep-alive socket: reconnect once
+            conn.close()
+            conn.request("GET", target)
+            return conn.getresponse()
+
     def fetch(self, path):
         # path is an URL
-        req = request.Request(path)
-        with request.urlopen(req) as response:
-            if response.code == 200:
-                the_page = response.read()
-                print(the_page)
+        for _ in range(self._max_redirects):
+            parts = parse.urlsplit(path)
+            key = (parts.scheme, parts.netloc)
+            target = parts.path or "/"
+            if parts.query:
+                target += "?" + parts.query
+            try:
+                response = self._get(self._connection(key), target)
+                if response.status in (301, 302, 303, 307, 308):
+                    location = response.getheader("Location")
+                    response.read()  # drain so the connection can be reused
+                    path = parse.urljoin(path, location)
+                    continue
+                if response.status == 200:
+                    # Stream in fixed-size chunks instead of buffering the whole page
+                    _copy_to_stdout(response)
+                else:
+                    response.read()  # drain so the connection can be reused
+            except BaseException:
+                # A half-read response would break the shared connection for every later fetch
+                self._evict(key)
+                raise
+            if response.status >= 400:
+                # Like urlopen: a failed fetch must not look like an empty page
+                raise error.HTTPError(path, response.status, response.reason,
+                                      response.headers, None)
+            return
+        raise error.HTTPError(path, response.status, "too many redirects",
+                              response.headers, None)
 
 # We can also add an implementation class to fetch content from a file on the local file system.
-class LocalFileFetcher(ResourceContentFetcher):
+class LocalFileFetcher:
     """Implement the Implementor interface and define its concrete implementation
     """
+    __slots__ = ()
+
     def fetch(self, path):
         # path is the filepath to a text file
-        with open(path) as f:
-            print(f.read())
+        with open(path, 'rb', buffering=1 << 16) as f:
+            _copy_to_stdout(f)
 
 # Test
 url_fetcher = URLFetcher()
@@ -14,15 +14,33 @@ team.
 
 # Step 1: The component interface
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 class Employee(ABC):
     """ Abstract base class for all employees
     """
+    # Slots all the way down the hierarchy, so tree nodes carry no __dict__
+    __slots__ = ('name', 'position', '_salary', '_parent')
+
     def __init__(self, name: str, position: str, salary: float):
         self.name = name
         self.position = position
-        self.salary = salary
+        self._parent: Optional["Manager"] = None
+        self._salary = salary
+
+    @property
+    def salary(self) -> float:
+        return self._salary
+
+    @salary.setter
+    def salary(self, value: float) -> None:
+        self._salary = value
+        self._salary_changed()
+
+    def _salary_changed(self):
+        # Every cached team total above this employee includes the old salary
+        if self._parent is not None:
+            self._parent._invalidate()
 
     @abstractmethod
     def get_salary(self) -> float:
@@ -32,37 +50,79 @@ class Employee(ABC):
     def show_details(self, indent:int = 0) -> str:
         pass
 
+    def _line(self, indent: int) -> str:
+        return " " * indent + f"{self.position}: {self.name} - ${self._salary:.2f}"
+
 # Step 2: The leaf
 class Developer(Employee):
+    __slots__ = ()
+
     def get_salary(self) -> float:
-        return self.salary
+        return self._salary
     
     def show_details(self, indent: int=0) -> str:
-        return " " * indent + f"{self.position}: {self.name} - ${self.salary:.2f}"
+        return self._line(indent)
 
 # Step 3: The Composite Manager has subordinates
 class Manager(Employee):
+    __slots__ = ('subordinates', '_cached_salary')
+
     def __init__(self, name: str, position: str, salary: float):
         super().__init__(name, position, salary)
         self.subordinates: List[Employee] = []
+        self._cached_salary: Optional[float] = None
 
     def add(self, employee: Employee):
+        # An employee has one manager: moving them must also refresh the old team's totals
+        if employee._parent is not None and employee._parent is not self:
+            employee._parent.remove(employee)
         self.subordinates.append(employee)
+        employee._parent = self
+        self._invalidate()
 
     def remove(self, employee: Employee):
-        self.subordinates.append(employee)
+        self.subordinates.remove(employee)
+        employee._parent = None
+        self._invalidate()
+
+    def _invalidate(self):
+        # The team changed, so this manager's total and every total above it are stale
+        node = self
+        while node is not None:
+            node._cached_salary = None
+            node = node._parent
+
+    def _salary_changed(self):
+        self._invalidate()
 
     def get_salary(self) -> float:
-        # Include managers own salart + subordinates
-        return self.salary + sum(e.get_salary() for e in self.subordinates)
+        if self._cached_salary is not None:
+            return self._cached_salary
+        # Include managers own salary + subordinates, walking the tree with an
+        # explicit stack so deep hierarchies cost one frame instead of one per level
+        total = 0.0
+        stack: List[Employee] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Manager):
+                if node is not self and node._cached_salary is not None:
+                    total += node._cached_salary
+                    continue
+                stack.extend(node.subordinates)
+            total += node._salary
+        self._cached_salary = total
+        return total
     
     def show_details(self, indent: int=0) -> str:
-        header = " " * indent + f"{self.position}: {self.name} - ${self.salary:.2f}"
-        if not self.subordinates:
-            return header
-        
-        details = "\n".join(e.show_details(indent + 1) for e in self.subordinates)
-        return f"{header}\n{details}"
+        # Iterative preorder, joined once over the whole tree
+        parts = []
+        stack = [(self, indent)]
+        while stack:
+            node, level = stack.pop()
+            parts.append(node._line(level))
+            if isinstance(node, Manager):
+                stack.extend((e, level + 1) for e in reversed(node.subordinates))
+        return "\n".join(parts)
     
 if __name__ == '__main__':
     # Lead employees
@@ -16,6 +16,8 @@ from abc import ABC, abstractmethod
 
 class FileSystemComponent(ABC):
     """ Base Class for both files and folders."""
+    __slots__ = ()
+
     @abstractmethod
     def show_details(self, indent=0):
         pass
@@ -26,6 +28,8 @@ class FileSystemComponent(ABC):
 
 # This is the Leaf
 class File(FileSystemComponent):
+    __slots__ = ('name', 'size')
+
     def __init__(self, name: str, size: int):
         self.name = name
         self.size = size
@@ -38,6 +42,8 @@ class File(FileSystemComponent):
     
 # This is the Composite
 class Folder(FileSystemComponent):
+    __slots__ = ('name', 'children')
+
     def __init__(self, name: str):
         self.name = name
         self.children: list[FileSystemComponent] = []
@@ -54,7 +60,16 @@ class Folder(FileSystemComponent):
             child.show_details(indent + 4)
 
     def get_size(self):
-        return sum(child.get_size() for child in self.children)
+        # Explicit stack: one frame and one running total for the whole subtree
+        total = 0
+        stack: list[FileSystemComponent] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Folder):
+                stack.extend(node.children)
+            else:
+                total += node.get_size()
+        return total
     
 # Now the folder can contain other components (files or foldersw) and
 # delegate operations to them recursively.
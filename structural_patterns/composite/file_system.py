@@ -5,11 +5,15 @@ Scenario: File System tree: Folders contain files and subfolders
 from abc import ABC, abstractmethod
 
 class Node(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def size(self) -> int:
         pass
 
 class File(Node):
+    __slots__ = ('name', '_size')
+
     def __init__(self, name, size):
         self.name = name
         self._size = size
@@ -18,6 +22,8 @@ class File(Node):
         return self._size
 
 class Folder(Node):
+    __slots__ = ('name', 'children')
+
     def __init__(self, name):
         self.name = name
         self.children = []
@@ -26,7 +32,16 @@ class Folder(Node):
         self.children.append(node)
 
     def size(self) -> int:
-        return sum(c.size() for c in self.children)
+        # Explicit stack: one frame and one running total for the whole subtree
+        total = 0
+        stack: list[Node] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Folder):
+                stack.extend(node.children)
+            else:
+                total += node.size()
+        return total
     
 
 if __name__ == "__main__":
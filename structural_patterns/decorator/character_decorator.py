@@ -5,11 +5,17 @@ without modifying the Player class
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from collections.abc import Mapping
 from dataclasses import dataclass
 import random
 
+_randint = random.randint
+
 # Component interface
 class Character(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def name(self) -> str:
         pass
@@ -27,11 +33,11 @@ class Character(ABC):
         pass
 
     @abstractmethod
-    def stats(self) -> dict:
+    def stats(self) -> Mapping:
         pass
 
 # Concrete component
-@dataclass
+@dataclass(slots=True)
 class Player(Character):
     _name: str
     hp: int
@@ -42,7 +48,7 @@ class Player(Character):
         return self._name
     
     def attack(self) -> int:
-        roll = self.base_attack + random.randint(0, 3)
+        roll = self.base_attack + _randint(0, 3)
         return roll
 
     def take_damage(self, dmg: int) -> None:
@@ -73,9 +79,15 @@ class CharacterDecorator(Character):
     def is_alive(self) -> bool:
         return self.inner.is_alive()
 
-    def stats(self) -> dict:
+    def stats(self) -> Mapping:
         return self.inner.stats()
 
+    def contribute(self, buffs: AggregatedBuffs) -> None:
+        """ Fold this layer's effect into buffs for flatten().
+        Every decorator must describe itself here, otherwise flattening would drop its overrides.
+        """
+        raise TypeError(f"{type(self).__name__} does not implement contribute() and cannot be flattened")
+
 # Concrete Decorators -> use the CharacterDecorator
 class SpeedBoost(CharacterDecorator):
     """ +X speed for N turns """
@@ -84,11 +96,14 @@ class SpeedBoost(CharacterDecorator):
         self.bonus_spd = bonus_spd
         self.turns = turns
 
-    def stats(self) -> dict:
-        s = self.inner.stats().copy()
-        s["spd"] += self.bonus_spd
-        s["buff_speed"] = f"+{self.bonus_spd} ({self.turns}t)"
-        return s
+    def stats(self) -> Mapping:
+        # Layer overrides on top of the inner stats instead of copying them
+        inner = self.inner.stats()
+        return ChainMap({"spd": inner["spd"] + self.bonus_spd,
+                         "buff_speed": f"+{self.bonus_spd} ({self.turns}t)"}, inner)
+
+    def contribute(self, buffs: AggregatedBuffs) -> None:
+        buffs.spd_bonus += self.bonus_spd
     
 class DamageBoost(CharacterDecorator):
     """ +% attack damage for N turns """
@@ -102,10 +117,12 @@ class DamageBoost(CharacterDecorator):
         boosted = int(round(base * (1 + self.percent)))
         return boosted
     
-    def stats(self) -> dict:
-        s = self.inner.stats().copy()
-        s["buff_attack"] = f"+{int(self.percent * 100)}% ({self.turns}t)"
-        return s
+    def stats(self) -> Mapping:
+        return ChainMap({"buff_attack": f"+{int(self.percent * 100)}% ({self.turns}t)"},
+                        self.inner.stats())
+
+    def contribute(self, buffs: AggregatedBuffs) -> None:
+        buffs.atk_mult *= 1 + self.percent
     
 class Shield(CharacterDecorator):
     """ Reduce damage by flat amount of N turns. """
@@ -118,38 +135,62 @@ class Shield(CharacterDecorator):
         mitigated = max(0, dmg - self.flat)
         self.inner.take_damage(mitigated)
 
-    def stats(self) -> dict:
-        s = self.inner.stats().copy()
-        s["buff_shield"] = f"-{self.flat} dmg ({self.turns}t)"
-        return s
+    def stats(self) -> Mapping:
+        return ChainMap({"buff_shield": f"-{self.flat} dmg ({self.turns}t)"},
+                        self.inner.stats())
+
+    def contribute(self, buffs: AggregatedBuffs) -> None:
+        buffs.flat += self.flat
     
+# Flattened view of a decorator chain
+@dataclass(slots=True)
+class AggregatedBuffs:
+    """ The combined effect of every active decorator, computed once per turn """
+    flat: int = 0
+    atk_mult: float = 1.0
+    spd_bonus: int = 0
+
+def flatten(char: Character) -> tuple[Player, AggregatedBuffs]:
+    """ Unwrap the decorator chain once and sum up its buffs, so a turn can
+    dispatch straight to the inner Player instead of walking every layer per call.
+    """
+    buffs = AggregatedBuffs()
+    while isinstance(char, CharacterDecorator):
+        char.contribute(buffs)
+        char = char.inner
+    return char, buffs
+
 # Utility: advance turns and drop expired decorators
 def end_of_turn(char: Character):
     """ Walk down the decorator chain. If a decorator has 'turns',
     decrement and drop it when it hits zero.
     """
-    # If it's not a decorator with turns, just return
-    if not isinstance(char, CharacterDecorator):
-        return char
-    
-    # first update inner layers
-    inner = end_of_turn(char.inner) 
-    # re-link in case inner changed
-    char.inner = inner
-
-    # If this decorator has a 'turns' attribute, tick it down.
-    if hasattr(char, "turns"):
-        char.turns -= 1
-        if char.turns <= 0:
-            # remove decorator, keep the inner
-            return char.inner
-    
-    return char
+    # The chain is a linked list through .inner, so unlink expired
+    # decorators in a single loop instead of recursing per layer
+    head = char
+    prev = None
+    cur = char
+    while isinstance(cur, CharacterDecorator):
+        nxt = cur.inner
+        # If this decorator has a 'turns' attribute, tick it down.
+        if hasattr(cur, "turns"):
+            cur.turns -= 1
+            if cur.turns <= 0:
+                # remove decorator, keep the inner
+                if prev is None:
+                    head = nxt
+                else:
+                    prev.inner = nxt
+                cur = nxt
+                continue
+        prev = cur
+        cur = nxt
+    return head
 
 if __name__ == "__main__":
     random.seed(1)
     hero: Character = Player("Aria", hp=50, base_attack=7, speed=5)
-    print("Turn 0 - base stats:", hero.stats())
+    print("Turn 0 - base stats:", dict(hero.stats()))
 
     # Pick up a speed boost (3 turns) and a shield (2 turns), then a damage boost (2 turns)
     hero = SpeedBoost(hero, bonus_spd=4, turns=3)
@@ -159,23 +200,26 @@ if __name__ == "__main__":
     # Simulate a few turns
     for turn in range(1, 6):
         print(f"\n--- Turn {turn} ---")
+        # Resolve the active buffs once for this turn
+        player, buffs = flatten(hero)
+
         # Attack
-        dmg = hero.attack()
+        dmg = int(round(player.attack() * buffs.atk_mult))
         print(f"{hero.name()} attacks for {dmg} damage")
 
         # Take incoming damage (simulate enemy hit)
         incoming = 10 + random.randint(-2, 2)
-        hero.take_damage(incoming)
+        player.take_damage(max(0, incoming - buffs.flat))
         print(f"{hero.name()} takes {incoming} incoming. Post-mitigation HP: {hero.stats()["hp"]}")
 
         # Show stats
-        print("Current stats:", hero.stats())
+        print("Current stats:", dict(hero.stats()))
         
         # Advance time: decorators with turns tick down and expire
         hero = end_of_turn(hero)
 
         # Also a report after expiration
-        print("After end of turn:", hero.stats())
+        print("After end of turn:", dict(hero.stats()))
         if not hero.is_alive():
             print(f"{hero.name()} is dead!")
             break
\ No newline at end of file
@@ -37,29 +37,30 @@ class SimpleCoffee(Coffee):
     
 # Base decorator
 class CoffeeDecorator(Coffee):
+    # What each add-on contributes; concrete decorators override these
+    _added_cost: float = 0.0
+    _added_desc: str = ""
+
     def __init__(self, coffee: Coffee):
         self._coffee = coffee
+        # Fold the wrapped coffee in once, so queries don't walk the whole chain
+        self._total = coffee.cost() + self._added_cost
+        self._description = coffee.description() + self._added_desc
     
     def cost(self) -> float:
-        return self._coffee.cost()
+        return self._total
 
     def description(self) -> str:
-        return self._coffee.description()
+        return self._description
     
 # Concrete decorators
 class MilkDecorator(CoffeeDecorator):
-    def cost(self) -> float:
-        return super().cost() + 1.5
-
-    def description(self) -> str:
-        return super().description() + "milk"
+    _added_cost = 1.5
+    _added_desc = "milk"
     
 class SugarDecorator(CoffeeDecorator):
-    def cost(self) -> float:
-        return super().cost() + 0.5
-    
-    def description(self):
-        return super().description() + "sugar"
+    _added_cost = 0.5
+    _added_desc = "sugar"
     
 
 if __name__ == '__main__':
@@ -16,53 +16,68 @@ Smart Home with separate services: Lights, thermostat, blinds, music, and securi
 4. Arm security
 5. Stop music
 """
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+import sys
+from typing import Iterator, Optional
+
+_LEAVE_HOME_ROOMS = ("Kitchen", "Living room", "Bedroom", "Hallway")
+
+class Reporting:
+    """ Mixin: subsystems report through _emit(), so the facade can collect a whole
+    routine's lines and write them in one go instead of one print() per step. """
+    _sink: Optional[list[str]] = None
+
+    def _emit(self, line: str) -> None:
+        if self._sink is None:
+            print(line)
+        else:
+            self._sink.append(line)
 
 @dataclass
-class LightSystem:
+class LightSystem(Reporting):
     def on(self, room: str, level: int=100) -> None:
-        print(f"Lights {room}: ON at {level}%")
+        self._emit(f"Lights {room}: ON at {level}%")
     
     def off(self, room: str) -> None:
-        print(f"[Lights] {room}: OFF")
+        self._emit(f"[Lights] {room}: OFF")
 
 @dataclass
-class Thermostat:
+class Thermostat(Reporting):
     current_temp : float = 21.0
 
     def set_target(self, celsius: float) -> None:
-        print(f"[Thermostat] Target set to {celsius:.1f} grad C")
+        self._emit(f"[Thermostat] Target set to {celsius:.1f} grad C")
         self.current_temp = celsius
 
 @dataclass
-class BlindController:
+class BlindController(Reporting):
     def lower(self, room: str) -> None:
-        print(f"[Blinds] {room}: LOWERED")
+        self._emit(f"[Blinds] {room}: LOWERED")
 
     def raise_blinds(self, room: str) -> None:
-        print(f"[Blinds] {room}: RAISED")
+        self._emit(f"[Blinds] {room}: RAISED")
 
 @dataclass
-class MusicSystem:
+class MusicSystem(Reporting):
     def play_playlist(self, name: str, room: Optional[str] = None) -> None:
         where = f" in {room}" if room else ""
-        print(f"[Music] Playing '{name}'{where}")
+        self._emit(f"[Music] Playing '{name}'{where}")
 
     def stop(self) -> None:
-        print("[Music] STOP")
+        self._emit("[Music] STOP")
 
 @dataclass
-class SecuritySystem:
+class SecuritySystem(Reporting):
     armed: bool = False
 
     def arm_stay(self) -> None:
         self.armed = True
-        print("[Security] ARMED (stay)")
+        self._emit("[Security] ARMED (stay)")
 
     def disarm(self) -> None:
         self.armed = False
-        print("[Security] DISARMED")
+        self._emit("[Security] DISARMED")
 
 # The Facade (simple API)
 @dataclass 
@@ -73,32 +88,49 @@ class SmartHomeFacade:
     music: MusicSystem
     security: SecuritySystem
 
+    def _bulk(self, lines: list[str]) -> None:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    @contextmanager
+    def _routine(self, title: str) -> Iterator[list[str]]:
+        # Point every subsystem at one buffer for the routine, then flush it with a single write
+        lines = [title]
+        subsystems = (self.lights, self.thermostat, self.blinds, self.music, self.security)
+        for subsystem in subsystems:
+            subsystem._sink = lines
+        try:
+            yield lines
+        finally:
+            for subsystem in subsystems:
+                del subsystem._sink
+            self._bulk(lines)
+
     # High-Level operations (routines)
     def good_morning(self) -> None:
-        print("### GOOD MORNING ###")
-        self.security.disarm()
-        self.blinds.raise_blinds("Bedroom")
-        self.lights.on("Bedroom", level=70)
-        self.thermostat.set_target(21.5)
-        self.music.play_playlist("Morning Rock", room="Kitchen")
+        with self._routine("### GOOD MORNING ###"):
+            self.security.disarm()
+            self.blinds.raise_blinds("Bedroom")
+            self.lights.on("Bedroom", level=70)
+            self.thermostat.set_target(21.5)
+            self.music.play_playlist("Morning Rock", room="Kitchen")
 
     def good_night(self) -> None:
-        print("### GOOD NIGHT ###")
-        self.music.stop()
-        self.lights.off("Living room")
-        self.lights.on("Bedroom", level=20)
-        self.blinds.lower("Bedroom")
-        self.thermostat.set_target(18.5)
-        self.security.arm_stay()
+        with self._routine("### GOOD NIGHT ###"):
+            self.music.stop()
+            self.lights.off("Living room")
+            self.lights.on("Bedroom", level=20)
+            self.blinds.lower("Bedroom")
+            self.thermostat.set_target(18.5)
+            self.security.arm_stay()
 
     def leave_home(self) -> None:
-        print("### LEAVE HOME ROUTINE ###")
-        for room in ("Kitchen", "Living room", "Bedroom", "Hallway"):
-            self.lights.off(room)
-        self.music.stop()
-        self.blinds.lower("Living room")
-        self.thermostat.set_target(17.0)
-        self.security.arm_stay()
+        with self._routine("### LEAVE HOME ROUTINE ###"):
+            for room in _LEAVE_HOME_ROOMS:
+                self.lights.off(room)
+            self.music.stop()
+            self.blinds.lower("Living room")
+            self.thermostat.set_target(17.0)
+            self.security.arm_stay()
 
 # Test
 facade = SmartHomeFacade(
@@ -7,49 +7,54 @@ wastes memory
 
 Instead, we can share common formatting settings among many characters."""
 
+from dataclasses import dataclass
+import sys
+from weakref import WeakValueDictionary
+
 # Intrinsic state: font, size, color
 # Extrinsic state: actual character 'a', 'b' and its position.
 
 # Context class
+@dataclass(slots=True, frozen=True)
 class Character:
-    def __init__(self, symbol, position, style):
-        self.symbol = symbol
-        self.position = position
-        self.style = style
+    symbol: str
+    position: tuple[int, int]
+    style: "CharacterStyle"
 
     def display(self):
         print(f"Character '{self.symbol}' at {self.position} with style {self.style}")
 
 
+# Flyweight: constructing a style returns the canonical shared instance,
+# so equal styles are the same object and can be compared with 'is'
 class CharacterStyle:
-    def __init__(self, font, size, color):
-        self.font = font
-        self.size = size
-        self.color = color
+    __slots__ = ('font', 'size', 'color', '__weakref__')
+    _pool = WeakValueDictionary()
+
+    def __new__(cls, font, size, color):
+        font = sys.intern(font)
+        color = sys.intern(color)
+        key = (font, size, color)
+        style = cls._pool.get(key)
+        if style is None:
+            style = object.__new__(cls)
+            style.font = font
+            style.size = size
+            style.color = color
+            cls._pool[key] = style
+            print(f"Created new CharacterStyle: {style}")
+        return style
 
     def __str__(self):
         return f"font={self.font}, size={self.size}, color={self.color}"
     
-# Flyweight Factory
-class CharacterStyleFactory:
-    _styles = {}
-
-    @classmethod
-    def get_style(cls, font, size, color):
-        key = (font, size, color)
-        if key not in cls._styles:
-            cls._styles[key] = CharacterStyle(font, size, color)
-            print(f"Created new CharacterStyle: {cls._styles[key]}")
-        return cls._styles[key]
-    
 # Client Code
 if __name__ == "__main__":
-    factory = CharacterStyleFactory()
     chars = []
 
     # Shared Styles
-    bold_style = factory.get_style("Arial", 12, "Black")
-    italic_style = factory.get_style("Arial", 12, "Gray")
+    bold_style = CharacterStyle("Arial", 12, "Black")
+    italic_style = CharacterStyle("Arial", 12, "Gray")
 
     # Characters share these styles
     chars.append(Character('H', (0, 0), bold_style))
@@ -18,19 +18,34 @@ Most cars are the same few models and don't change. (candidates for flyweight ob
 
 Each car instance needs dynamic fields like id, x, y, speed, heading (extrinsic state)"""
 
-from dataclasses import dataclass
-from typing import Dict, Tuple
-from weakref import WeakValueDictionary
+from array import array
+from itertools import groupby
+from typing import Dict, Iterable, Tuple
 
-@dataclass(frozen=True)
 class CarModel:
-    make: str
-    model: str
-    year: int
-    # PRetend these are big blobs (mesh, texture, specs)
-    mesh_bytes: bytes
-    texture_bytes: bytes
-    engine_spec: str
+    __slots__ = ('make', 'model', 'year', 'engine_spec', '_mesh', '_texture')
+
+    def __init__(self, make: str, model: str, year: int, engine_spec: str) -> None:
+        self.make = make
+        self.model = model
+        self.year = year
+        self.engine_spec = engine_spec
+        # PRetend these are big blobs (mesh, texture); only loaded once something reads them
+        self._mesh: bytes | None = None
+        self._texture: bytes | None = None
+
+    @property
+    def mesh_bytes(self) -> bytes:
+        if self._mesh is None:
+            # simulate heavy loading work
+            self._mesh = b"/x200" * 2_000_000
+        return self._mesh
+
+    @property
+    def texture_bytes(self) -> bytes:
+        if self._texture is None:
+            self._texture = b"/x00" * 2_000_000
+        return self._texture
 
     def render(self, x: float, y: float, heading_deg: float, plate: str) -> None:
         """Use the shared model data plus extrinsic state (positino, heading, etc.)
@@ -49,21 +64,19 @@ class CarModel:
 # Flyweight factory: returns "shared" CarModel instances
 class CarModelFactory:
     def __init__(self) -> None:
-        # WeakValueDictionary lets models be garbage collected if no one holds them.
-        self._pool: "WeakValueDictionary[Tuple[str, str, int], CarModel]" = WeakValueDictionary()
+        # Models live as long as the simulation, so a plain dict: no weakref bookkeeping per lookup.
+        self._pool: Dict[Tuple[str, str, int], CarModel] = {}
     
     def get(self, make: str, model: str, year: int) -> CarModel:
         key = (make, model, year)
         car_model = self._pool.get(key)
         if car_model is None:
-            # simulate heavy loading work
-            print(f"[Factory] Loading heavy stuff for {key} once...")
+            # the heavy mesh/texture blobs are deferred until a renderer reads them
+            print(f"[Factory] Creating shared model for {key} once...")
             car_model = CarModel(
                 make=make,
                 model=model,
                 year=year,
-                mesh_bytes=b"/x200" * 2_000_000,
-                texture_bytes=b"/x00" * 2_000_000,
                 engine_spec="2.0L V3"
             )
             self._pool[key] = car_model
@@ -72,23 +85,94 @@ class CarModelFactory:
     def stats(self) -> int:
         return len(self._pool)
     
-# Context objects: tiny, many, reference the shared model
-@dataclass
-class Car:
-    plate: str
-    x: float
-    y: float
-    heading_deg: float
-    model: CarModel # The flyweight reference
+# Context objects: many cars, each referencing a shared model.
+# Stored struct-of-arrays: one packed float32 array per field instead of one Python
+# object per car, and a small index into the fleet's flyweight table for the model.
+class CarFleet:
+    __slots__ = ('plates', 'x', 'y', 'heading_deg', 'model_idx', 'models', '_model_index', '_draw_order')
 
-    def tick(self, dt: float) -> None:
-        # Update extrinsic state
-        self.x += dt * 5
-        self.heading_deg = (self.heading_deg  + dt * 3) % 360
+    _max_models = 1 << 16  # capacity of the unsigned short 'H' model index
 
-    def draw(self) -> None:
+    def __init__(self) -> None:
+        self.plates: list[str] = []
+        self.x = array('f')
+        self.y = array('f')
+        self.heading_deg = array('f')
+        self.model_idx = array('H')
+        self.models: list[CarModel] = []  # The flyweight table
+        self._model_index: Dict[int, int] = {}
+        # Car positions sorted by model, so drawing batches each shared CarModel together
+        self._draw_order: list[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.plates)
+
+    def model_slot(self, model: CarModel) -> int:
+        """ Index of the model in the fleet's flyweight table, adding it if needed """
+        idx = self._model_index.get(id(model))
+        if idx is None:
+            idx = len(self.models)
+            if idx >= self._max_models:
+                raise OverflowError(f"a CarFleet holds at most {self._max_models} models")
+            self._model_index[id(model)] = idx
+            self.models.append(model)
+        return idx
+
+    def add(self, plate: str, x: float, y: float, heading_deg: float, model: CarModel) -> None:
+        idx = self.model_slot(model)  # may raise: resolve before touching any column
+        self.plates.append(plate)
+        self.x.append(x)
+        self.y.append(y)
+        self.heading_deg.append(heading_deg)
+        self.model_idx.append(idx)
+        self._draw_order = None
+
+    def add_many(self, plates: Iterable[str], x: Iterable[float], y: Iterable[float],
+                 heading_deg: Iterable[float], model_idx: Iterable[int]) -> None:
+        """ Append whole columns at once; model_idx values come from model_slot() """
+        # Materialize and validate every column before extending any, so a bad call
+        # can't leave the fleet with columns of different lengths
+        plates = list(plates)
+        x = array('f', x)
+        y = array('f', y)
+        heading_deg = array('f', heading_deg)
+        model_idx = array('H', model_idx)
+        n = len(plates)
+        if not len(x) == len(y) == len(heading_deg) == len(model_idx) == n:
+            raise ValueError("add_many() columns must all have the same length")
+        if model_idx and max(model_idx) >= len(self.models):
+            raise ValueError("add_many() model_idx values must come from model_slot()")
+        self.plates.extend(plates)
+        self.x.extend(x)
+        self.y.extend(y)
+        self.heading_deg.extend(heading_deg)
+        self.model_idx.extend(model_idx)
+        self._draw_order = None
+
+    def tick(self, dt: float) -> None:
+        # Update extrinsic state of the whole fleet in place, one pass per field:
+        # no temporary lists, and references to the columns stay valid
+        dx = dt * 5
+        dh = dt * 3
+        x = self.x
+        for i in range(len(x)):
+            x[i] += dx
+        heading = self.heading_deg
+        for i in range(len(heading)):
+            heading[i] = (heading[i] + dh) % 360
+
+    def draw(self, i: int) -> None:
         # Pass exstrinsic state to the shared flyweight
-        self.model.render(self.x, self.y, self.heading_deg, self.plate)
+        self.models[self.model_idx[i]].render(self.x[i], self.y[i], self.heading_deg[i], self.plates[i])
+
+    def draw_all(self) -> None:
+        model_of = self.model_idx.__getitem__
+        if self._draw_order is None:
+            self._draw_order = sorted(range(len(self)), key=model_of)
+        for idx, group in groupby(self._draw_order, key=model_of):
+            model = self.models[idx]
+            for i in group:
+                model.render(self.x[i], self.y[i], self.heading_deg[i], self.plates[i])
 
 if __name__ == "__main__":
     factory = CarModelFactory()
@@ -97,26 +181,24 @@ if __name__ == "__main__":
     civic_model = factory.get("Honda", "Civic", 2022)
     model3 = factory.get("Tesla", "Model3", 2023)
 
-    cars = []
-    for i in range(50000):
-        if i % 3:
-            model = civic_model
-        else:
-            model = model3
-        cars.append(
-            Car(
-                plate=f"XYZ-{i:05d}",
-                x=i % 500,
-                y=(i // 500) % 500,
-                heading_deg=(i * 7) % 360,
-                model=model
-            )
-        )
+    cars = CarFleet()
+    # Resolve the shared models once, then hand the fleet whole columns
+    civic_idx = cars.model_slot(civic_model)
+    model3_idx = cars.model_slot(model3)
+    ids = range(50000)
+    cars.add_many(
+        plates=[f"XYZ-{i:05d}" for i in ids],
+        x=[i % 500 for i in ids],
+        y=[(i // 500) % 500 for i in ids],
+        heading_deg=[(i * 7) % 360 for i in ids],
+        model_idx=[civic_idx if i % 3 else model3_idx for i in ids]
+    )
     print(f"Unique CarModel flyweights: {factory.stats()}")  # -> 2
     print(f"Total cars (contexts): {len(cars)}")             # -> 50000
 
     # Use the cars (render a few frames of a few cars)
-    for c in cars[:3]:
-        c.draw()
-        c.tick(0.16)
-        c.draw()
+    for i in range(3):
+        cars.draw(i)
+    cars.tick(0.16)
+    for i in range(3):
+        cars.draw(i)
@@ -1,6 +1,7 @@
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Tuple
-from weakref import WeakValueDictionary
+from itertools import groupby, islice
+from typing import Dict, Iterable, Iterator, Tuple
 
 # ---------- Flyweight (intrinsic state) ----------
 @dataclass(frozen=True, slots=True)
@@ -17,9 +18,10 @@ class TreeType:
 class TreeTypeFactory:
     """
     Returns shared TreeType instances keyed by (name, color, texture_id).
-    WeakValueDictionary lets GC collect unused flyweights.
+    A plain dict: tree types are needed for the whole run, so weak references
+    would only add bookkeeping (and slotted TreeType can't be weakly referenced).
     """
-    _cache: "WeakValueDictionary[Tuple[str, str, str], TreeType]" = WeakValueDictionary()
+    _cache: Dict[Tuple[str, str, str], TreeType] = {}
 
     @classmethod
     def get(cls, name: str, color: str, texture_id: str) -> TreeType:
@@ -42,36 +44,103 @@ class Tree:
     height: int
     type: TreeType  # shared flyweight
 
+    @classmethod
+    def _fast(cls, x: int, y: int, height: int, type: TreeType) -> "Tree":
+        # Skip the generated __init__ (argument parsing + an extra frame) for bulk construction
+        t = object.__new__(cls)
+        t.x = x
+        t.y = y
+        t.height = height
+        t.type = type
+        return t
+
     def draw(self) -> None:
         # delegate drawing to the shared flyweight, passing extrinsic state
         self.type.draw(self.x, self.y, self.height)
 
 # ---------- Client that builds many trees ----------
 class Forest:
+    """
+    Stores trees struct-of-arrays: packed int arrays for the extrinsic state plus a
+    small index into the forest's table of shared TreeTypes. Tree objects are only
+    materialized when iterating.
+    """
+    _max_types = 1 << 16  # capacity of the unsigned short 'H' type index
+
     def __init__(self):
-        self._trees: list[Tree] = []
+        self._x = array('i')
+        self._y = array('i')
+        self._height = array('i')
+        self._type_idx = array('H')
+        self._types: list[TreeType] = []
+        self._type_index: Dict[TreeType, int] = {}
+        # Tree positions sorted by type, so drawing batches each shared TreeType together
+        self._draw_order: list[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def __iter__(self) -> Iterator[Tree]:
+        types = self._types
+        for x, y, height, idx in zip(self._x, self._y, self._height, self._type_idx):
+            yield Tree._fast(x, y, height, types[idx])
+
+    def _type_slot(self, tree_type: TreeType) -> int:
+        idx = self._type_index.get(tree_type)
+        if idx is None:
+            idx = len(self._types)
+            if idx >= self._max_types:
+                raise OverflowError(f"a Forest holds at most {self._max_types} tree types")
+            self._type_index[tree_type] = idx
+            self._types.append(tree_type)
+        return idx
 
     def plant_tree(self, x: int, y: int, height: int, name: str, color: str, texture_id: str):
         tree_type = TreeTypeFactory.get(name, color, texture_id)  # shared
-        self._trees.append(Tree(x, y, height, tree_type))         # tiny per-tree
+        idx = self._type_slot(tree_type)  # may raise: resolve before touching any column
+        self._x.append(x)                                         # tiny per-tree
+        self._y.append(y)
+        self._height.append(height)
+        self._type_idx.append(idx)
+        self._draw_order = None
+
+    def plant_many(self, coords: Iterable[Tuple[int, int, int]], name: str, color: str, texture_id: str):
+        """ Plant many (x, y, height) trees of one species: the shared type is resolved once. """
+        columns = tuple(zip(*coords))  # consumes generators too
+        if not columns:
+            return
+        # Build every column before extending any, so a bad value can't misalign the forest
+        xs, ys, heights = (array('i', column) for column in columns)
+        idx = self._type_slot(TreeTypeFactory.get(name, color, texture_id))
+        self._x.extend(xs)
+        self._y.extend(ys)
+        self._height.extend(heights)
+        self._type_idx.extend(array('H', [idx]) * len(xs))
+        self._draw_order = None
 
     def draw(self):
-        for t in self._trees:
-            t.draw()
+        type_of = self._type_idx.__getitem__
+        if self._draw_order is None:
+            self._draw_order = sorted(range(len(self)), key=type_of)
+        xs, ys, heights = self._x, self._y, self._height
+        for idx, group in groupby(self._draw_order, key=type_of):
+            tree_type = self._types[idx]
+            for i in group:
+                tree_type.draw(xs[i], ys[i], heights[i])
 
 if __name__ == "__main__":
     forest = Forest()
 
     # Plant thousands of trees that share just a few appearances
-    for i in range(5000):
-        forest.plant_tree(x=i % 500, y=i // 500, height=8,  name="Oak",   color="green", texture_id="oak_tex")
-        forest.plant_tree(x=i % 500, y=i // 500, height=10, name="Pine",  color="dark",  texture_id="pine_tex")
-        forest.plant_tree(x=i % 500, y=i // 500, height=6,  name="Birch", color="light", texture_id="birch_tex")
+    grid = [(i % 500, i // 500) for i in range(5000)]
+    forest.plant_many([(x, y, 8) for x, y in grid],  name="Oak",   color="green", texture_id="oak_tex")
+    forest.plant_many([(x, y, 10) for x, y in grid], name="Pine",  color="dark",  texture_id="pine_tex")
+    forest.plant_many([(x, y, 6) for x, y in grid],  name="Birch", color="light", texture_id="birch_tex")
 
-    # We planted 15,000 Tree objects, but only 3 shared TreeType flyweights:
-    print("Trees:", len(forest._trees))
+    # We planted 15,000 trees, but only 3 shared TreeType flyweights:
+    print("Trees:", len(forest))
     print("Unique TreeTypes (flyweights):", TreeTypeFactory.unique_count())
 
     # Draw a sample
-    for t in forest._trees[:3]:
-        t.draw()
\ No newline at end of file
+    for t in islice(forest, 3):
+        t.draw()
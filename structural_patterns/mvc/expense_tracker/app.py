@@ -3,7 +3,7 @@ from controller import ExpenseController
 from model import ExpenseRepository
 
 def main():
-    repo = ExpenseRepository(db_path=Path("./data/expenses.json"))
+    repo = ExpenseRepository(db_path=Path("./data/expenses.jsonl"))
     controller = ExpenseController(repo)
     keep_going = True
     while keep_going:
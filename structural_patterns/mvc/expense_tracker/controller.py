@@ -1,4 +1,5 @@
-from typing import Optional
+import sys
+from typing import Callable, Optional
 from model import ExpenseRepository
 import view
 
@@ -8,30 +9,52 @@ class ExpenseController:
     """
     def __init__(self, repo: ExpenseRepository):
         self.repo = repo
+        # Menu choice -> action; each action returns False to stop the loop
+        self._handlers: dict[str, Callable[[], bool]] = {
+            "1": self._add,
+            "2": self._list,
+            "3": self._filter,
+            "4": self._total,
+            "5": self._delete,
+            "0": self._quit,
+        }
 
     def run_once(self) -> bool:
         view.show_menu()
         choice = view.get_choice()
 
-        if choice == "1":
-            amount, category, note = view.prompt_new_expense()
-            added = self.repo.add(amount, category, note)
-            view.notify(f"Added expense {added.id}")
-        elif choice == "2":
-            view.show_expenses(self.repo.list_all())
-        elif choice == "3":
-            cat = view.prompt_category()
-            view.show_expenses(self.repo.filter_by_category(cat))
-        elif choice == "4":
-            cat = input("Leave blank for grand total or enter a category: ").strip()
-            total = self.repo.total(cat or None)
-            view.show_total(total, cat or None)
-        elif choice == "5":
-            expense_id = view.prompt_expense_id()
-            ok = self.repo.delete(expense_id)
-            view.notify("Deleted" if ok else "No expense found with that ID.")
-        elif choice == "0":
-            return False  # stop the loop
-        else:
+        handler = self._handlers.get(choice)
+        if handler is None:
             view.notify("Invalid option. Try again.")
-        return True
\ No newline at end of file
+            return True
+        return handler()
+
+    def _add(self) -> bool:
+        amount, category, note = view.prompt_new_expense()
+        added = self.repo.add(amount, category, note)
+        view.notify(f"Added expense {added.id_text}")
+        return True
+
+    def _list(self) -> bool:
+        view.show_expenses(self.repo.list_all())
+        return True
+
+    def _filter(self) -> bool:
+        cat = sys.intern(view.prompt_category())
+        view.show_expenses(self.repo.filter_by_category(cat))
+        return True
+
+    def _total(self) -> bool:
+        cat = input("Leave blank for grand total or enter a category: ").strip()
+        total = self.repo.total(cat or None)
+        view.show_total(total, cat or None)
+        return True
+
+    def _delete(self) -> bool:
+        expense_id = view.prompt_expense_id()
+        ok = self.repo.delete(expense_id)
+        view.notify("Deleted" if ok else "No expense found with that ID.")
+        return True
+
+    def _quit(self) -> bool:
+        return False  # stop the loop
@@ -1,69 +1,175 @@
+import base64
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
 import json
+import os
+import sys
+import time
 from pathlib import Path
 import uuid
 
+try:
+    import orjson
+except ImportError:  # optional: the stdlib json module produces the same file, just slower
+    orjson = None
+
+def encode_id(raw: bytes) -> str:
+    """ 16 raw uuid bytes -> 22-char url-safe token (vs. 36 chars for the dashed form) """
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+def decode_id(text: str) -> bytes:
+    if len(text) == 22:
+        return base64.urlsafe_b64decode(text + "==")
+    # older records and user input may still use the dashed uuid form
+    return uuid.UUID(text).bytes
+
+def _parse_created_at(value) -> float:
+    if isinstance(value, str):
+        # older records stored a naive UTC ISO timestamp
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+    return float(value)
+
 @dataclass
 class Expense:
-    id: str
+    id: bytes
     amount: float
     category: str
     note: str
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    # seconds since the epoch; the view builds a datetime only for rows it displays
+    created_at: float = field(default_factory=time.time)
 
     @staticmethod
     def from_dict(d: dict) -> "Expense":
         return Expense(
-            id=d["id"],
+            id=decode_id(d["id"]),
             amount=float(d["amount"]),
-            category=d["category"],
+            # a handful of categories repeat across every record: share one string each
+            category=sys.intern(d["category"]),
             note=d.get("note", ""),
-            created_at=datetime.fromisoformat(d["created_at"])
+            created_at=_parse_created_at(d["created_at"])
         )
     
+    @property
+    def id_text(self) -> str:
+        return encode_id(self.id)
+
     def to_dict(self) -> dict:
         return {
-            "id": self.id,
+            "id": encode_id(self.id),
             "amount": self.amount,
             "category": self.category,
             "note": self.note,
-            "created_at": self.created_at.isoformat()
+            "created_at": self.created_at
         }
     
+if orjson is not None:
+    def _dump_line(expense: Expense) -> bytes:
+        return orjson.dumps(expense.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+else:
+    def _dump_line(expense: Expense) -> bytes:
+        return (json.dumps(expense.to_dict()) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
 class ExpenseRepository:
-    """ Json file repository to keep the example realistic"""
+    """ JSON Lines file repository to keep the example realistic.
+    One expense per line, so adding an expense is a single append instead of a full rewrite.
+    """
     def __init__(self, db_path: Path):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.db_path.exists():
-            self._write([])
+        # Parsed expenses, valid while the file's mtime is unchanged
+        self._cache: Optional[List[Expense]] = None
+        self._cache_mtime: int = 0
+        # id -> position in the cached list, kept in step with the cache
+        self._index: dict[bytes, int] = {}
+        self._create_if_missing()
+
+    def _create_if_missing(self) -> None:
+        # O_EXCL folds the existence check and the creation into one race-free call;
+        # the directory is only created when the file can't be opened for lack of it
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+        try:
+            os.close(os.open(self.db_path, flags))
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.close(os.open(self.db_path, flags))
+            except FileExistsError:
+                pass
+
+    def _cache_is_fresh(self) -> bool:
+        return self._cache is not None and self.db_path.stat().st_mtime_ns == self._cache_mtime
 
     def _read(self) -> List[Expense]:
-        data = json.loads(self.db_path.read_text(encoding="utf-8"))
-        return [Expense.from_dict(item) for item in data]
+        if not self._cache_is_fresh():
+            lines = self.db_path.read_bytes().splitlines()
+            self._cache = [Expense.from_dict(_loads(line)) for line in lines if line]
+            self._index = {e.id: i for i, e in enumerate(self._cache)}
+            self._cache_mtime = self.db_path.stat().st_mtime_ns
+        return list(self._cache)
     
     def _write(self, expenses: List[Expense]) -> None:
-        data = [e.to_dict() for e in expenses]
-        self.db_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Full rewrite, only needed when removing entries
+        self.db_path.write_bytes(b"".join(_dump_line(e) for e in expenses))
+        self._cache = list(expenses)
+        self._index = {e.id: i for i, e in enumerate(self._cache)}
+        self._cache_mtime = self.db_path.stat().st_mtime_ns
+
+    def _append(self, expense: Expense) -> None:
+        fresh = self._cache_is_fresh()
+        with self.db_path.open("ab") as f:
+            f.write(_dump_line(expense))
+        if fresh:
+            self._index[expense.id] = len(self._cache)
+            self._cache.append(expense)
+            self._cache_mtime = self.db_path.stat().st_mtime_ns
+        else:
+            self._cache = None
+
+    def _iter_dicts(self) -> Iterator[dict]:
+        # Stream raw records line by line, without building Expense objects
+        with self.db_path.open("rb") as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
 
     def list_all(self) -> List[Expense]:
         return self._read()
+
+    def filter_by_category(self, category: str) -> Iterator[Expense]:
+        if self._cache_is_fresh():
+            return (e for e in self._cache if e.category == category)
+        # Only matching records pay for Expense construction (and datetime parsing)
+        return (Expense.from_dict(d) for d in self._iter_dicts() if d["category"] == category)
+
+    def total(self, category: Optional[str] = None) -> float:
+        if self._cache_is_fresh():
+            return sum(e.amount for e in self._cache if category is None or e.category == category)
+        return sum(float(d["amount"]) for d in self._iter_dicts()
+                   if category is None or d["category"] == category)
     
     
     def add(self, amount: float, category: str, note: str = "") -> Expense:
-        expense = Expense(id=str(uuid.uuid4()), amount=amount, category=category, note=note)
-        items = self._read()
-        items.append(expense)
-        self._write(items)
+        expense = Expense(id=uuid.uuid4().bytes, amount=amount, category=category, note=note)
+        self._append(expense)
         return expense
     
     def delete(self, expense_id: str) -> bool:
+        try:
+            raw_id = decode_id(expense_id)
+        except ValueError:
+            return False
         items = self._read()
-        new_items = [e for e in items if e.id != expense_id]
-        changed = len(new_items) != len(items)
-        if changed:
-            self._write(new_items)
-        return changed
+        # ids are unique, so one index lookup finds the only match
+        idx = self._index.get(raw_id)
+        if idx is None:
+            return False
+        del items[idx]
+        self._write(items)
+        return True
     
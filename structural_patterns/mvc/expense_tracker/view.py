@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterable, Optional
 from datetime import datetime
 from model import Expense
 
@@ -32,14 +32,17 @@ def prompt_category() -> str:
 def prompt_expense_id() -> str:
     return input("Expense ID to delete: ").strip()
 
-def show_expenses(expenses: List[Expense]) -> None:
-    if not expenses:
-        print("(No expenses found)")
-        return
-    print("\nID                                   | Amount   | Category   | Date                | Note")
-    print("-" * 95)
+def show_expenses(expenses: Iterable[Expense]) -> None:
+    # Accepts lazy iterables too, so the header is printed on the first row
+    found = False
     for e in expenses:
-        print(f"{e.id} | {e.amount:8.2f} | {e.category:<10} | {e.created_at.strftime('%Y-%m-%d %H:%M')} | {e.note}")
+        if not found:
+            print("\nID                     | Amount   | Category   | Date                | Note")
+            print("-" * 81)
+            found = True
+        print(f"{e.id_text} | {e.amount:8.2f} | {e.category:<10} | {datetime.fromtimestamp(e.created_at).strftime('%Y-%m-%d %H:%M')} | {e.note}")
+    if not found:
+        print("(No expenses found)")
 
 def show_total(amount: float, category: Optional[str] = None) -> None:
     if category:
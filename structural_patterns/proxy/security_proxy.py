@@ -7,7 +7,7 @@ real service.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import time
 from collections import defaultdict, deque
 
@@ -43,7 +43,15 @@ class InMemoryDocumentStore(DocumentService):
 @dataclass(frozen=True)
 class User:
     username: str
-    roles: set[str]
+    roles: frozenset[str]
+    # Union of the roles' permissions, resolved once here instead of on every request
+    perms: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Roles are frozen too, so a revoked role can't leave stale rights in perms
+        object.__setattr__(self, "roles", frozenset(self.roles))
+        perms = frozenset().union(*(ROLE_PERMS.get(r, ()) for r in self.roles))
+        object.__setattr__(self, "perms", perms)
 
 # Map roles -> allowed actions
 ROLE_PERMS = {
@@ -81,8 +89,7 @@ class SecureDocumentProxy(DocumentService):
 
     # helpers
     def _check_perm(self, user: User, action: str) -> None:
-        allowed = set().union(*(ROLE_PERMS.get(r, set()) for r in user.roles))
-        if action not in allowed:
+        if action not in user.perms:
             self._audit(f"{user.username} DENIED {action.upper()}")
             raise PermissionError
         